@@ -3,13 +3,33 @@
 Audio Plugin GUI Designer Package
 """
 
-from src.components.component import Component
-from src.panels.canvas import DragDropCanvas
-from src.panels.toolbox import ComponentToolbox
-from src.panels.properties import PropertiesPanel
-from src.code_generator import CodeGenerator
-from src.file_manager import FileManager
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "MyAwesomePluginCompany"
 __description__ = "A drag-and-drop interface designer for audio plugins"
+
+# Public names are imported on first access so that importing the package
+# does not pull in the whole canvas/UI stack
+_LAZY_IMPORTS = {
+    "Component": ("src.components.component", "Component"),
+    "DragDropCanvas": ("src.panels.canvas", "DragDropCanvas"),
+    "ComponentToolbox": ("src.panels.toolbox", "ComponentToolbox"),
+    "PropertiesPanel": ("src.panels.properties", "PropertiesPanel"),
+    "CodeGenerator": ("src.code_generator", "CodeGenerator"),
+    "FileManager": ("src.file_manager", "FileManager"),
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+def __getattr__(name):
+    """Import lazily exported names on first access (PEP 562)."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_path, attr = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module_path), attr)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
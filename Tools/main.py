@@ -1,86 +1,156 @@
 import os
 import tkinter as tk
-from tkinter import messagebox, ttk
+from tkinter import messagebox, scrolledtext, ttk
+import shutil
 import subprocess
+import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 import re
-from typing import Dict, Any, List, Tuple
-from src.UIGeneratorApp import UIGeneratorApp
+import json
+import hashlib
+import mmap
+import time
+import queue
+import threading
+import functools
+import contextlib
+import collections
+from typing import Dict, Any, List, Optional, Tuple
 
 # Static variables
 SRC_DIR = r"D:/Dev/Visual Studio Projects/AudioPlugins/MyAwesomePluginCompany/Template/MyCMakeProject"  # Template source
 DST_DIR = r"D:/Dev/Visual Studio Projects/AudioPlugins/MyAwesomePluginCompany/MyAwesomePlugins"  # Project destination
 TEMPLATE_NAME = "MyCMakeProject"  # The template name to replace in files and filenames
 
-def cmake_ready(build_dir: str) -> bool:
-    """Check if CMake has been run successfully by looking for CMakeCache.txt."""
+# Directory names skipped when copying the template / scanning it for placeholders
+COPY_SKIP_DIRS = frozenset({'out', '.vs'})
+TEMPLATE_SCAN_SKIP_DIRS = frozenset({'out', '.vs', 'build', '.git'})
+# Text files that might contain placeholders
+TEMPLATE_TEXT_EXTENSIONS = frozenset({'.txt', '.cmake', '.cpp', '.h', '.hpp', '.c', '.cc', '.cxx'})
+
+# Precompiled patterns (compiled once at import, not per file or per call)
+_PLACEHOLDER_BYTES_RE = re.compile(rb'\{\{[A-Z_][A-Z0-9_]*\}\}')  # {{PLACEHOLDER}} tokens in template files
+_FOUR_CHAR_CODE_RE = re.compile(r'[A-Za-z0-9]{4}')  # JUCE plugin/manufacturer codes
+
+# Project summary patterns, matched against the raw bytes of a CMakeLists.txt
+PROJECT_INFO_READ_SIZE = 16384  # Bytes read from the top of CMakeLists.txt for the project list
+_PROJECT_INFO_RE = re.compile(rb'project\s*\(\s*([^)]+)\)', re.IGNORECASE)
+_PRODUCT_NAME_INFO_RE = re.compile(rb'PRODUCT_NAME\s+"([^"]+)"')
+_FORMATS_INFO_RE = re.compile(rb'FORMATS\s+([^\n]+)')
+# Case-insensitive fallback for the rare non-lowercase spelling; avoids lowercasing a copy of the file
+_JUCE_ADD_PLUGIN_RE = re.compile(rb'juce_add_plugin', re.IGNORECASE)
+
+# Common JUCE plugin patterns to extract actual values, as (compiled pattern, placeholder).
+# Patterns run on raw file bytes.
+_CMAKE_VALUE_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), placeholder) for pattern, placeholder in (
+    # JUCE plugin configuration
+    (rb'PRODUCT_NAME\s+"([^"]+)"', '{{PRODUCT_NAME}}'),
+    (rb'COMPANY_NAME\s+"([^"]+)"', '{{COMPANY_NAME}}'),
+    (rb'PLUGIN_MANUFACTURER_CODE\s+([A-Za-z0-9]{4})', '{{PLUGIN_MANUFACTURER_CODE}}'),
+    (rb'PLUGIN_CODE\s+([A-Za-z0-9]{4})', '{{PLUGIN_CODE}}'),
+    (rb'VERSION\s+(\d+\.\d+\.\d+)', '{{PROJECT_VERSION}}'),
+    (rb'project\s*\(\s*([^)\s]+)', '{{PROJECT_NAME}}'),
+    
+    # Additional patterns
+    (rb'DESCRIPTION\s+"([^"]+)"', '{{DESCRIPTION}}'),
+    (rb'PLUGIN_CATEGORY\s+([^\s\n]+)', '{{PLUGIN_CATEGORY}}'),
+    (rb'set\s*\(\s*CMAKE_CXX_STANDARD\s+(\d+)', '{{CXX_STANDARD}}'),
+))
+
+COPY_MMAP_THRESHOLD = 64 * 1024  # Files above this size are checked in place before being read
+
+CMAKE_READY_TTL = 2.0  # Seconds a cmake_ready result is reused before re-checking the disk
+_cmake_ready_cache: Dict[str, Tuple[float, bool]] = {}
+
+@functools.lru_cache(maxsize=8)
+def _cmake_cache_path(build_dir: str) -> str:
+    """Return the normalized CMakeCache.txt path for a build directory."""
     cmake_cache = os.path.join(build_dir, "out", "build", "x64-Debug", "CMakeCache.txt")
     ## make sure cmake_cache uses consistent path separators
-    cmake_cache = os.path.normpath(cmake_cache)
-    return os.path.isfile(cmake_cache)
+    return os.path.normpath(cmake_cache)
+
+def cmake_ready(build_dir: str) -> bool:
+    """Check if CMake has been run successfully by looking for CMakeCache.txt.
+    Results are cached for CMAKE_READY_TTL seconds so repeated polling stays cheap."""
+    now = time.monotonic()
+    cached = _cmake_ready_cache.get(build_dir)
+    if cached and now - cached[0] < CMAKE_READY_TTL:
+        return cached[1]
+    
+    ready = os.path.isfile(_cmake_cache_path(build_dir))
+    _cmake_ready_cache[build_dir] = (now, ready)
+    return ready
+
+def invalidate_cmake_ready(build_dir: str):
+    """Drop the cached cmake_ready result after CMake has touched build_dir."""
+    _cmake_ready_cache.pop(build_dir, None)
 
 def scan_existing_projects() -> List[Tuple[str, str]]:
     """Scan the DST_DIR for existing plugin projects."""
     projects = []
     
-    if not os.path.exists(DST_DIR):
-        return projects
-    
     try:
-        for item in os.listdir(DST_DIR):
-            project_path = os.path.join(DST_DIR, item)
-            
-            # Check if it's a directory and contains CMakeLists.txt
-            if os.path.isdir(project_path):
-                cmake_file = os.path.join(project_path, "CMakeLists.txt")
-                if os.path.exists(cmake_file):
-                    # Get project info
-                    project_info = get_project_info(project_path)
-                    projects.append((item, project_info))
+        with os.scandir(DST_DIR) as it:
+            for entry in it:
+                # Check if it's a directory (type comes from the listing, no extra stat)
+                if not entry.is_dir():
+                    continue
+                
+                # Get project info; None means there is no CMakeLists.txt
+                project_info = get_project_info(entry.path)
+                if project_info is not None:
+                    projects.append((entry.name, project_info))
         
         # Sort by project name
         projects.sort(key=lambda x: x[0].lower())
         
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"Warning: Failed to scan existing projects: {e}")
     
     return projects
 
-def get_project_info(project_path: str) -> str:
-    """Get brief info about a project by examining its CMakeLists.txt file."""
+def get_project_info(project_path: str) -> Optional[str]:
+    """Get brief info about a project by examining its CMakeLists.txt file.
+    Returns None when the project has no CMakeLists.txt."""
     try:
         cmake_file = os.path.join(project_path, "CMakeLists.txt")
-        if not os.path.exists(cmake_file):
-            return "No CMakeLists.txt found"
-        
-        with open(cmake_file, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        try:
+            with open(cmake_file, 'rb') as f:
+                # project() / PRODUCT_NAME / FORMATS sit near the top, so only the head is read
+                content = f.read(PROJECT_INFO_READ_SIZE)
+                project_match = _PROJECT_INFO_RE.search(content)
+                if project_match is None and len(content) == PROJECT_INFO_READ_SIZE:
+                    content += f.read()
+                    project_match = _PROJECT_INFO_RE.search(content)
+                mod_time = os.fstat(f.fileno()).st_mtime
+        except FileNotFoundError:
+            return None
         
         # Extract some key information
         info_parts = []
         
         # Look for project name
-        project_match = re.search(r'project\s*\(\s*([^)]+)\)', content, re.IGNORECASE)
         if project_match:
-            info_parts.append(f"Project: {project_match.group(1).strip()}")
+            info_parts.append(f"Project: {project_match.group(1).decode('utf-8', 'ignore').strip()}")
         
         # Look for JUCE plugin info
-        if 'juce_add_plugin' in content.lower():
+        if b'juce_add_plugin' in content or _JUCE_ADD_PLUGIN_RE.search(content):
             # Extract product name
-            product_match = re.search(r'PRODUCT_NAME\s+"([^"]+)"', content)
+            product_match = _PRODUCT_NAME_INFO_RE.search(content)
             if product_match:
-                info_parts.append(f"Product: {product_match.group(1)}")
+                info_parts.append(f"Product: {product_match.group(1).decode('utf-8', 'ignore')}")
             
             # Extract formats
-            formats_match = re.search(r'FORMATS\s+([^\n]+)', content)
+            formats_match = _FORMATS_INFO_RE.search(content)
             if formats_match:
-                formats = formats_match.group(1).strip()
+                formats = formats_match.group(1).decode('utf-8', 'ignore').strip()
                 info_parts.append(f"Formats: {formats}")
         
-        # Check modification time
-        mod_time = os.path.getmtime(cmake_file)
-        import datetime
-        mod_date = datetime.datetime.fromtimestamp(mod_time).strftime("%Y-%m-%d")
+        # Modification time (from the open file, no second path lookup)
+        mod_date = time.strftime("%Y-%m-%d", time.localtime(mod_time))
         info_parts.append(f"Modified: {mod_date}")
         
         return " | ".join(info_parts) if info_parts else "JUCE Plugin Project"
@@ -89,139 +159,521 @@ def get_project_info(project_path: str) -> str:
         return f"Error reading project: {str(e)}"
 
 def extract_cmake_values_from_project(project_path: str) -> Dict[str, str]:
-    """Extract CMake placeholder values from an existing project."""
+    """Extract CMake placeholder values from an existing project.
+    Files are checked from most to least authoritative and the first value found
+    for a placeholder is kept, so later files only fill in what is still missing."""
     cmake_values = {}
     
     try:
-        # Check main CMakeLists.txt
-        cmake_file = os.path.join(project_path, "CMakeLists.txt")
-        if os.path.exists(cmake_file):
-            cmake_values.update(_extract_values_from_file(cmake_file))
+        source_dir = os.path.join(project_path, "Source")
+        # Main CMakeLists.txt, then Source/CMakeLists.txt (missing files come back as an empty dict)
+        candidate_files = [os.path.join(project_path, "CMakeLists.txt"),
+                           os.path.join(source_dir, "CMakeLists.txt")]
         
-        # Check Source/CMakeLists.txt
-        source_cmake = os.path.join(project_path, "Source", "CMakeLists.txt")
-        if os.path.exists(source_cmake):
-            cmake_values.update(_extract_values_from_file(source_cmake))
+        # Then the source files for any additional values
+        try:
+            candidate_files.extend(os.path.join(source_dir, file) for file in sorted(os.listdir(source_dir))
+                                   if file.endswith(('.cpp', '.h', '.hpp')))
+        except FileNotFoundError:
+            pass
         
-        # Check source files for any additional values
-        source_dir = os.path.join(project_path, "Source")
-        if os.path.exists(source_dir):
-            for file in os.listdir(source_dir):
-                if file.endswith(('.cpp', '.h', '.hpp')):
-                    file_path = os.path.join(source_dir, file)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                        values = _extract_values_from_content(content)
-                        cmake_values.update(values)
-                    except Exception:
-                        continue
+        for file_path in candidate_files:
+            # Every placeholder has a value: the remaining files cannot add anything
+            if len(cmake_values) == len(_CMAKE_VALUE_PATTERNS):
+                break
+            cmake_values.update(_extract_values_from_file(file_path, cmake_values))
         
     except Exception as e:
         print(f"Warning: Failed to extract CMake values from {project_path}: {e}")
     
     return cmake_values
 
-def _extract_values_from_file(file_path: str) -> Dict[str, str]:
+def _extract_values_from_file(file_path: str, skip=()) -> Dict[str, str]:
     """Extract values from a single file."""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        with open(file_path, 'rb') as f:
             content = f.read()
-        return _extract_values_from_content(content)
+        return _extract_values_from_content(content, skip)
     except Exception:
         return {}
 
-def _extract_values_from_content(content: str) -> Dict[str, str]:
-    """Extract placeholder values from file content by analyzing actual values."""
+def _extract_values_from_content(content: bytes, skip=()) -> Dict[str, str]:
+    """Extract placeholder values from file content by analyzing actual values.
+    Content is the raw file bytes; only the captured values are decoded.
+    Placeholders in skip (already found elsewhere) are not searched for."""
     values = {}
     
-    # Common JUCE plugin patterns to extract actual values
-    patterns = {
-        # JUCE plugin configuration
-        r'PRODUCT_NAME\s+"([^"]+)"': '{{PRODUCT_NAME}}',
-        r'COMPANY_NAME\s+"([^"]+)"': '{{COMPANY_NAME}}',
-        r'PLUGIN_MANUFACTURER_CODE\s+([A-Za-z0-9]{4})': '{{PLUGIN_MANUFACTURER_CODE}}',
-        r'PLUGIN_CODE\s+([A-Za-z0-9]{4})': '{{PLUGIN_CODE}}',
-        r'VERSION\s+(\d+\.\d+\.\d+)': '{{PROJECT_VERSION}}',
-        r'project\s*\(\s*([^)\s]+)': '{{PROJECT_NAME}}',
-        
-        # Additional patterns
-        r'DESCRIPTION\s+"([^"]+)"': '{{DESCRIPTION}}',
-        r'PLUGIN_CATEGORY\s+([^\s\n]+)': '{{PLUGIN_CATEGORY}}',
-        r'set\s*\(\s*CMAKE_CXX_STANDARD\s+(\d+)': '{{CXX_STANDARD}}',
-    }
-    
-    for pattern, placeholder in patterns.items():
-        matches = re.finditer(pattern, content, re.IGNORECASE)
-        for match in matches:
-            actual_value = match.group(1).strip().strip('"')
-            if actual_value and placeholder not in values:
+    for pattern, placeholder in _CMAKE_VALUE_PATTERNS:
+        if placeholder in skip:
+            continue
+        # Only the first non-empty match counts, so stop scanning once it is found
+        for match in pattern.finditer(content):
+            actual_value = match.group(1).decode('utf-8', 'ignore').strip().strip('"')
+            if actual_value:
                 values[placeholder] = actual_value
+                break
     
     return values
 
+def _scandir_tree(path, skip_dirs=()):
+    """Yield os.DirEntry objects under path, each directory before its contents.
+    Directories whose name is in skip_dirs are neither yielded nor descended into.
+    Symlinks to directories are skipped as well (os.walk does not follow them either,
+    and a link back up the tree would otherwise never end); symlinked files are yielded.
+    Uses an explicit stack of os.scandir calls, so entry types come from the
+    directory listing instead of a stat per entry as with os.walk."""
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in skip_dirs:
+                        continue
+                    stack.append(entry.path)
+                elif entry.is_symlink() and entry.is_dir():
+                    continue
+                yield entry
+
 def copy_and_replace(src, dst, template_name, project_name, cmake_fields=None):
     """Recursively copy src to dst, replacing template_name with project_name in file contents and names. 
     Skips 'out' and '.vs' directories."""
-    if not os.path.exists(dst):
-        os.makedirs(dst)
+    os.makedirs(dst, exist_ok=True)
+    
+    # Files are processed as bytes; the template name is a plain ASCII token
+    template_bytes = template_name.encode('utf-8')
+    project_bytes = project_name.encode('utf-8')
+    
+    # cmake_fields is invariant for the whole copy, so build the replacer only once
+    replacements = _active_replacements(cmake_fields.get("custom_replacements", {}) if cmake_fields else {})
+    # The whole replace pipeline stays in bytes, so files are never decoded
+    byte_replacements = {placeholder.encode('utf-8'): value.encode('utf-8')
+                         for placeholder, value in replacements.items()}
+    placeholder_bytes = tuple(byte_replacements)
+    # Templates use {{PLACEHOLDER}} tokens, so one b"{{" search rules most files out
+    # before checking each placeholder (an empty gate always passes)
+    placeholder_gate = b"{{" if all(placeholder.startswith(b"{{") for placeholder in placeholder_bytes) else b""
+    # One alternation search tells whether any placeholder occurs in a single pass,
+    # instead of one substring scan per placeholder
+    has_placeholder = _compile_placeholder_pattern(placeholder_bytes).search if placeholder_bytes else (lambda content: None)
+    
+    # The template name is replaced first and the placeholders are substituted in the
+    # renamed content, so a placeholder that contains the template (or project) name
+    # behaves exactly as with separate passes
+    replace_placeholders = _build_replacer(byte_replacements)
         
-    for root, dirs, files in os.walk(src):
-        # Skip 'out' and '.vs' directories at any level
-        dirs[:] = [d for d in dirs if d not in ('out', '.vs')]
+    # Collect the whole target layout before touching the destination
+    dirs_to_make = set()
+    file_jobs = []
+    # Entry paths all start with src + separator, so plain slicing and concatenation
+    # replace the per-entry os.path.relpath/os.path.join calls
+    src_prefix_len = len(os.path.join(src, ""))
+    dst_prefix = os.path.join(dst, "")
+    for entry in _scandir_tree(src, COPY_SKIP_DIRS):
+        rel_path = entry.path[src_prefix_len:]
+        if template_name in rel_path:
+            rel_path = rel_path.replace(template_name, project_name)
+        target_path = dst_prefix + rel_path
         
-        rel_path = os.path.relpath(root, src)
-        target_root = os.path.join(dst, rel_path.replace(template_name, project_name))
+        if entry.is_dir():
+            dirs_to_make.add(target_path)
+        else:
+            file_jobs.append((entry, target_path))
+    
+    # Create the directory tree on this thread first, then copy the files in parallel.
+    # A parent path sorts before its children and dst already exists, so a single
+    # mkdir per directory suffices (makedirs would stat every parent again)
+    for target_dir in sorted(dirs_to_make):
+        try:
+            os.mkdir(target_dir)
+        except FileExistsError:
+            pass
+    
+    def copy_file(job):
+        """Copy a single template file, substituting names and placeholders."""
+        entry, target_file = job
+        src_file = entry.path
         
-        if not os.path.exists(target_root):
-            os.makedirs(target_root)
-            
-        for file in files:
-            src_file = os.path.join(root, file)
-            target_file = os.path.join(target_root, file.replace(template_name, project_name))
+        try:
+            size = entry.stat().st_size
+            # Large files (assets, prebuilt libraries) are searched in place through the page
+            # cache first, so those with nothing to substitute are never read into Python
+            if size > COPY_MMAP_THRESHOLD and not _file_contains_any(src_file, (placeholder_gate, template_bytes)):
+                content = None
+            else:
+                # Read straight into a buffer sized from the directory entry
+                content = bytearray(size)
+                with open(src_file, 'rb') as f:
+                    bytes_read = f.readinto(content)
+                del content[bytes_read:]
             
-            try:
-                with open(src_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                # Replace template name in content
-                content = content.replace(template_name, project_name)
+            substituted = False
+            if content is not None:
+                if template_bytes in content:
+                    content = content.replace(template_bytes, project_bytes)
+                    substituted = True
                 
                 # Apply CMake field replacements to all files (not just CMakeLists.txt)
                 # This allows placeholders in source files too
-                if cmake_fields:
-                    content = apply_cmake_replacements(content, cmake_fields)
+                if placeholder_gate in content and has_placeholder(content):
+                    content = replace_placeholders(content)
+                    substituted = True
+            
+            if not substituted:
+                # Nothing to substitute: skip files an earlier run copied and nobody has
+                # touched since (see _is_up_to_date), otherwise let the OS copy the file
+                src_stat = entry.stat()
+                if _is_up_to_date(src_stat, target_file):
+                    return
+                shutil.copyfile(src_file, target_file)
+                # Stamp the copy with the source mtime so the next run can recognise it
+                os.utime(target_file, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+                return
+            
+            # The whole file is already in memory, so skip the 8 KB BufferedWriter
+            # and hand the buffer straight to write(2)
+            with open(target_file, 'wb', buffering=0) as f:
+                remaining = memoryview(content)
+                while remaining:
+                    remaining = remaining[f.write(remaining):]
                 
-                with open(target_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                    
-            except Exception as e:
-                print(f"Warning: Could not process file {src_file}: {e}")
-                # Copy file as-is if processing fails
-                try:
-                    with open(src_file, 'rb') as src_f, open(target_file, 'wb') as dst_f:
-                        dst_f.write(src_f.read())
-                except Exception as copy_error:
-                    print(f"Error: Could not copy file {src_file}: {copy_error}")
+        except Exception as e:
+            print(f"Warning: Could not process file {src_file}: {e}")
+            # Copy file as-is if processing fails
+            try:
+                shutil.copyfile(src_file, target_file)
+            except Exception as copy_error:
+                print(f"Error: Could not copy file {src_file}: {copy_error}")
+    
+    # Small templates are not worth the thread start-up cost
+    if len(file_jobs) < 2:
+        for job in file_jobs:
+            copy_file(job)
+        return
+    
+    # Files are independent and the work is mostly blocking I/O, so threads overlap well;
+    # never start more workers than there are files
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_jobs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Drain the results so any unexpected exception is re-raised here
+        for _ in executor.map(copy_file, file_jobs):
+            pass
+
+def _file_contains_any(path, needles):
+    """Return True if any of needles occurs in the file, searching it through an mmap
+    instead of reading it into memory."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return any(mapped.find(needle) != -1 for needle in needles)
+
+def _is_up_to_date(src_stat, target_file):
+    """Return True if target_file is an untouched copy of the source: same size and
+    exactly the source's mtime, which copy_and_replace stamps on every plain copy.
+    A target edited since then has a different mtime and is overwritten."""
+    try:
+        target_stat = os.stat(target_file)
+    except OSError:
+        return False
+    return target_stat.st_size == src_stat.st_size and target_stat.st_mtime_ns == src_stat.st_mtime_ns
+
+def _active_replacements(replacements):
+    """Return the replacement pairs that have both a placeholder and a value,
+    ordered longest placeholder first so a placeholder that is a prefix of
+    another (e.g. {{PROJECT_NAME}} vs {{PROJECT_NAME_LOWER}}) never shadows it."""
+    active = [(placeholder, value) for placeholder, value in replacements.items()
+              if placeholder and value]
+    active.sort(key=lambda item: len(item[0]), reverse=True)
+    return dict(active)
+
+def _build_replacer(replacements):
+    """Build a callable that applies all (placeholder, value) pairs in a single scan,
+    or None when there is nothing to replace. Works on str or bytes pairs alike.
+    
+    The placeholders are combined into one regex alternation, in the longest-first
+    order given by _active_replacements, instead of running one str.replace pass
+    per placeholder.
+    """
+    # Skip empty entries up front; placeholders are literals and are escaped below
+    mapping = _active_replacements(replacements)
+    if not mapping:
+        return None
+    
+    # A single needle needs no per-match Python callback
+    if len(mapping) == 1:
+        (placeholder, value), = mapping.items()
+        return lambda content: content.replace(placeholder, value)
+    
+    pattern = _compile_placeholder_pattern(tuple(mapping))
+    return lambda content: pattern.sub(lambda match: mapping[match[0]], content)
+
+@functools.lru_cache(maxsize=16)
+def _compile_placeholder_pattern(placeholders):
+    """Compile one alternation matching any of the given literal (str or bytes) placeholders.
+    Cached, so repeated calls with the same table reuse the compiled pattern.
+    The regex parser factors the shared "{{" prefix out of the branches, so the
+    common case does not backtrack over it for every placeholder."""
+    separator = b"|" if isinstance(placeholders[0], bytes) else "|"
+    return re.compile(separator.join(re.escape(placeholder) for placeholder in placeholders))
 
 def apply_cmake_replacements(content, cmake_fields):
     """Apply CMake field replacements to CMakeLists.txt content.
     
     Since templates now use consistent {{PLACEHOLDER}} format,
-    we can simplify the replacement logic.
+    we can simplify the replacement logic: set(X "{{PLACEHOLDER}}") and
+    set(X {{PLACEHOLDER}}) are both handled by the same single literal scan.
+    Content may be str or bytes (as read by copy_and_replace); for bytes the
+    placeholders and values are encoded as UTF-8 so the file is never decoded.
     """
-    replacements = cmake_fields.get("custom_replacements", {})
+    replacements = _active_replacements(cmake_fields.get("custom_replacements", {}))
+    if isinstance(content, (bytes, bytearray)):
+        replacements = {placeholder.encode('utf-8'): value.encode('utf-8')
+                        for placeholder, value in replacements.items()}
+    
+    # A plain substring test is far cheaper than building and running the replacer
+    if not any(placeholder in content for placeholder in replacements):
+        return content
     
-    # Apply all placeholder replacements
-    for placeholder, value in replacements.items():
-        if not placeholder or not value:  # Skip empty entries
+    # Direct placeholder replacement (templates use {{PLACEHOLDER}} format)
+    return _build_replacer(replacements)(content)
+
+PLACEHOLDER_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "juce_pm", "placeholders.json")
+
+def _template_mtime_key(src_dir: str) -> int:
+    """Return the newest mtime (ns) in the template tree; changes whenever a file is
+    edited, added or removed. Only stats entries, no file is opened."""
+    newest = os.stat(src_dir).st_mtime_ns
+    for entry in _scandir_tree(src_dir, TEMPLATE_SCAN_SKIP_DIRS):
+        newest = max(newest, entry.stat().st_mtime_ns)
+    return newest
+
+def _load_placeholder_cache(src_dir: str, mtime_key: int):
+    """Return cached placeholders for src_dir, or None if the cache is missing or stale."""
+    try:
+        with open(PLACEHOLDER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if cache.get("src_dir") != src_dir or cache.get("mtime") != mtime_key:
+        return None
+    return cache.get("placeholders")
+
+def _save_placeholder_cache(src_dir: str, mtime_key: int, placeholders: List[str]):
+    """Persist the scanned placeholders so the next launch can skip the scan.
+    Written to a temporary file and swapped in with os.replace, so a concurrent
+    launch never reads a half-written cache."""
+    temp_file = f"{PLACEHOLDER_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(PLACEHOLDER_CACHE_FILE), exist_ok=True)
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({"src_dir": src_dir, "mtime": mtime_key, "placeholders": placeholders}, f)
+        os.replace(temp_file, PLACEHOLDER_CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: Could not write placeholder cache: {e}")
+
+def _find_template_placeholders(src_dir: str) -> List[str]:
+    """Read the template's text files and return the sorted {{PLACEHOLDER}} tokens found."""
+    found_placeholders = set()
+    
+    # Skip build directories
+    for entry in _scandir_tree(src_dir, TEMPLATE_SCAN_SKIP_DIRS):
+        if not entry.is_file():
             continue
         
-        # Direct placeholder replacement (templates use {{PLACEHOLDER}} format)
-        content = content.replace(placeholder, value)
+        file = entry.name
+        _, ext = os.path.splitext(file)
+        
+        # Check if file might contain placeholders (empty files cannot be mapped)
+        if (ext.lower() in TEMPLATE_TEXT_EXTENSIONS or file == 'CMakeLists.txt') and entry.stat().st_size:
+            try:
+                # Scan the file in place through the page cache instead of reading it into a str
+                with open(entry.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    # Most template files hold no placeholders; a literal search rules them out
+                    if mapped.find(b'{{') == -1:
+                        continue
+                    # Find all {{PLACEHOLDER}} patterns in one C-level pass
+                    found_placeholders.update(_PLACEHOLDER_BYTES_RE.findall(mapped))
+                    
+            except Exception as e:
+                # Skip files that can't be read
+                continue
+    
+    # Only the matched tokens are decoded
+    return sorted(placeholder.decode('ascii') for placeholder in found_placeholders)
+
+def scan_template_files():
+    """Scan template files for placeholders and return sensible defaults.
+    The placeholder list is cached on disk and reused while the template is unchanged."""
+    if not os.path.exists(SRC_DIR):
+        return get_fallback_defaults()
+    
+    mtime_key = _template_mtime_key(SRC_DIR)
+    placeholders = _load_placeholder_cache(SRC_DIR, mtime_key)
+    if placeholders is None:
+        placeholders = _find_template_placeholders(SRC_DIR)
+        _save_placeholder_cache(SRC_DIR, mtime_key, placeholders)
+    
+    # Convert to list with sensible defaults
+    return [(placeholder, get_default_value(placeholder)) for placeholder in placeholders]
+
+# (substrings that must all occur, default value), checked in order; first hit wins
+_DEFAULT_VALUE_RULES = (
+    (('VERSION',), "1.0.0"),
+    (('PROJECT_NAME',), "MyProject"),
+    (('PRODUCT_NAME',), "My Product"),
+    (('COMPANY', 'CODE'), "Mcmp"),  # 4-char manufacturer code
+    (('MANUFACTURER', 'CODE'), "Mcmp"),
+    (('COMPANY',), "MyCompany"),
+    (('MANUFACTURER',), "MyCompany"),
+    (('PLUGIN_CODE',), "MYPG"),  # 4-char plugin code
+    (('STANDARD',), "17"),
+    (('CATEGORY',), "Effect"),
+    (('DESCRIPTION',), "Audio Plugin Project"),
+)
+
+def get_default_value(placeholder):
+    """Get a sensible default value for a placeholder."""
+    placeholder_upper = placeholder.upper()
+    
+    for needles, default in _DEFAULT_VALUE_RULES:
+        if all(needle in placeholder_upper for needle in needles):
+            return default
     
-    return content
+    # Generic default: convert SNAKE_CASE to Title Case
+    return placeholder.strip('{}').replace('_', ' ').title()
 
+def get_fallback_defaults():
+    """Return fallback defaults if template scanning fails."""
+    return [
+        ("{{PROJECT_NAME}}", "DriveR"),
+        ("{{PROJECT_VERSION}}", "1.0.0"),
+        ("{{PLUGIN_MANUFACTURER_CODE}}", "Mcmp"),
+        ("{{PLUGIN_CODE}}", "Drvr"),
+        ("{{PRODUCT_NAME}}", "Drive R"),
+    ]
+
+# Placeholder -> item id for the custom replacements table. Kept in sync by the
+# helpers below so duplicate checks are a dict lookup instead of a walk over every row
+_replacement_index: Dict[str, str] = {}
+# Item id -> (find, replace) mirror of the table, so reading rows back needs no
+# Tcl round-trip per row (and values keep their str type, Tk may return ints)
+_replacement_rows: Dict[str, Tuple[str, str]] = {}
+
+def insert_replacement_row(tree, find_text, replace_text, index="end", iid=None):
+    """Insert a row into the replacements table and index its placeholder."""
+    item = tree.insert("", index, iid=iid, values=(find_text, replace_text))
+    _replacement_index[find_text] = item
+    _replacement_rows[item] = (find_text, replace_text)
+    return item
+
+def update_replacement_row(tree, item, find_text, replace_text):
+    """Change a row of the replacements table, re-indexing its placeholder."""
+    old_find_text = get_replacement_row(tree, item)[0]
+    if _replacement_index.get(old_find_text) == item:
+        del _replacement_index[old_find_text]
+    
+    tree.item(item, values=(find_text, replace_text))
+    _replacement_index[find_text] = item
+    _replacement_rows[item] = (find_text, replace_text)
+
+def get_replacement_row(tree, item):
+    """Return the (find, replace) values of a row, from the mirror when possible."""
+    row = _replacement_rows.get(item)
+    if row is None:
+        # Row was not added through the helpers; ask Tk
+        values = tree.item(item, "values")
+        row = tuple(str(value) for value in values[:2]) if len(values) >= 2 else ()
+    return row
+
+def delete_replacement_rows(tree, *items):
+    """Delete rows from the replacements table and drop them from the index."""
+    for item in items:
+        row = _replacement_rows.pop(item, None)
+        find_text = row[0] if row else str(tree.item(item, "values")[0])
+        if _replacement_index.get(find_text) == item:
+            del _replacement_index[find_text]
+    
+    if items:
+        tree.delete(*items)
+
+class _ReusableDialog:
+    """Modal dialog whose window is built once and hidden between uses instead of
+    being recreated every time.
+    
+    Subclasses set WIDTH/HEIGHT, build their widgets in self.window and call
+    _show() after refreshing them; closing the window calls on_close().
+    """
+    
+    WIDTH = 400
+    HEIGHT = 150
+    
+    def __init__(self, parent=None):
+        self.window = tk.Toplevel(parent)
+        self.window.withdraw()
+        self.window.transient(parent)
+        self.window.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Center the window (computed once, the window is reused)
+        x = (self.window.winfo_screenwidth() // 2) - (self.WIDTH // 2)
+        y = (self.window.winfo_screenheight() // 2) - (self.HEIGHT // 2)
+        self.window.geometry(f"{self.WIDTH}x{self.HEIGHT}+{x}+{y}")
+    
+    def on_close(self):
+        self.hide()
+    
+    def _show(self, title):
+        self.window.title(title)
+        self.window.deiconify()
+        self.window.grab_set()
+    
+    def hide(self):
+        self.window.grab_release()
+        self.window.withdraw()
+
+class _ReplacementDialog(_ReusableDialog):
+    """Find/replace dialog shared by the add and edit actions."""
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.on_commit = None
+        
+        ttk.Label(self.window, text="Find (Placeholder):").grid(row=0, column=0, sticky="w", padx=10, pady=5)
+        self.find_entry = ttk.Entry(self.window, width=40)
+        self.find_entry.grid(row=0, column=1, padx=10, pady=5)
+        
+        ttk.Label(self.window, text="Replace With:").grid(row=1, column=0, sticky="w", padx=10, pady=5)
+        self.replace_entry = ttk.Entry(self.window, width=40)
+        self.replace_entry.grid(row=1, column=1, padx=10, pady=5)
+        
+        button_frame = ttk.Frame(self.window)
+        button_frame.grid(row=2, column=0, columnspan=2, pady=10)
+        
+        self.commit_button = ttk.Button(button_frame, command=self._commit)
+        self.commit_button.pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.hide).pack(side="left", padx=5)
+    
+    def show(self, title, commit_text, on_commit, find_text="", replace_text=""):
+        """Show the dialog pre-filled with the given values.
+        on_commit(find_text, replace_text) returns True when the entry was accepted."""
+        self.on_commit = on_commit
+        self.commit_button.configure(text=commit_text)
+        
+        self.find_entry.delete(0, tk.END)
+        self.find_entry.insert(0, find_text)
+        self.replace_entry.delete(0, tk.END)
+        self.replace_entry.insert(0, replace_text)
+        
+        self._show(title)
+        self.find_entry.focus()
+    
+    def _commit(self):
+        find_text = self.find_entry.get().strip()
+        replace_text = self.replace_entry.get().strip()
+        
+        if not find_text:
+            messagebox.showerror("Error", "Find field cannot be empty")
+            return
+        
+        if self.on_commit(find_text, replace_text):
+            self.hide()
 
 def create_custom_replacements_table(parent):
     """Create a table for custom find/replace relationships."""
@@ -253,142 +705,75 @@ def create_custom_replacements_table(parent):
     button_frame.pack(fill="x", pady=5)
 
     # Find and replace all replaceable strings in all CMakeLists.txt files
-    default_entries = []
-    
-    def scan_template_files():
-        """Scan template files for placeholders and return sensible defaults."""
-        found_placeholders = set()
+    fallback_entries = get_fallback_defaults()
+    
+    def insert_default_rows(entries, id_prefix):
+        # Explicit item ids spare Tk from searching for a free id on every insert
+        for index, (find_text, replace_text) in enumerate(entries):
+            insert_replacement_row(tree, find_text, replace_text, index, iid=f"{id_prefix}{index}")
+    
+    # Show the fallback rows straight away; the template scan runs on a worker
+    # thread and hands its result back through a queue (Tk is not thread-safe)
+    insert_default_rows(fallback_entries, "default")
+    scan_results = queue.Queue()
+    
+    def scan_in_background():
+        try:
+            scan_results.put(scan_template_files())
+        except Exception as e:
+            print(f"Warning: Template scanning failed, using fallback defaults: {e}")
+            scan_results.put(None)
+    
+    def apply_scan_results():
+        try:
+            default_entries = scan_results.get_nowait()
+        except queue.Empty:
+            tree.after(50, apply_scan_results)
+            return
         
-        if not os.path.exists(SRC_DIR):
-            return get_fallback_defaults()
+        # Leave the table alone if it was repopulated (e.g. a project was loaded) or
+        # emptied meanwhile: none of the fallback rows are left then
+        fallback_rows = {f"default{index}": tuple(entry) for index, entry in enumerate(fallback_entries)}
+        remaining_ids = [item for item in fallback_rows if item in _replacement_rows]
+        if default_entries is None or not remaining_ids:
+            return
         
-        # Get all text files that might contain placeholders
-        text_extensions = {'.txt', '.cmake', '.cpp', '.h', '.hpp', '.c', '.cc', '.cxx'}
+        # Only fallback rows the user has not edited are replaced; edited and added rows
+        # are kept, and the original placeholder of a fallback row the user edited or
+        # removed is not brought back
+        untouched_ids = [item for item in remaining_ids if _replacement_rows[item] == fallback_rows[item]]
+        dismissed = {find_text for item, (find_text, _) in fallback_rows.items() if item not in untouched_ids}
+        delete_replacement_rows(tree, *untouched_ids)
         
-        for root, dirs, files in os.walk(SRC_DIR):
-            # Skip build directories
-            dirs[:] = [d for d in dirs if d not in ('out', '.vs', 'build', '.git')]
-            
-            for file in files:
-                file_path = os.path.join(root, file)
-                _, ext = os.path.splitext(file)
-                
-                # Check if file might contain placeholders
-                if ext.lower() in text_extensions or file == 'CMakeLists.txt':
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                        
-                        # Find all {{PLACEHOLDER}} patterns
-                        placeholders = re.findall(r'\{\{([A-Z_][A-Z0-9_]*)\}\}', content)
-                        for placeholder in placeholders:
-                            placeholder_full = f"{{{{{placeholder}}}}}"
-                            found_placeholders.add(placeholder_full)
-                            
-                    except Exception as e:
-                        # Skip files that can't be read
-                        continue
-        
-        # Convert to list with sensible defaults
-        return [(placeholder, get_default_value(placeholder)) for placeholder in sorted(found_placeholders)]
-    
-    def get_default_value(placeholder):
-        """Get a sensible default value for a placeholder."""
-        placeholder_upper = placeholder.upper()
-        
-        if 'VERSION' in placeholder_upper:
-            return "1.0.0"
-        elif 'PROJECT_NAME' in placeholder_upper or placeholder_upper == '{{PROJECT_NAME}}':
-            return "MyProject"
-        elif 'PRODUCT_NAME' in placeholder_upper:
-            return "My Product"
-        elif 'COMPANY' in placeholder_upper or 'MANUFACTURER' in placeholder_upper:
-            if 'CODE' in placeholder_upper:
-                return "Mcmp"  # 4-char manufacturer code
-            else:
-                return "MyCompany"
-        elif 'PLUGIN_CODE' in placeholder_upper:
-            return "MYPG"  # 4-char plugin code
-        elif 'STANDARD' in placeholder_upper:
-            return "17"
-        elif 'CATEGORY' in placeholder_upper:
-            return "Effect"
-        elif 'DESCRIPTION' in placeholder_upper:
-            return "Audio Plugin Project"
-        else:
-            # Generic default: convert SNAKE_CASE to Title Case
-            return placeholder.strip('{}').replace('_', ' ').title()
-    
-    def get_fallback_defaults():
-        """Return fallback defaults if template scanning fails."""
-        return [
-            ("{{PROJECT_NAME}}", "DriveR"),
-            ("{{PROJECT_VERSION}}", "1.0.0"),
-            ("{{PLUGIN_MANUFACTURER_CODE}}", "Mcmp"),
-            ("{{PLUGIN_CODE}}", "Drvr"),
-            ("{{PRODUCT_NAME}}", "Drive R"),
-        ]
-    
-    try:
-        default_entries = scan_template_files()
-    except Exception as e:
-        print(f"Warning: Template scanning failed, using fallback defaults: {e}")
-        default_entries = get_fallback_defaults()
-
+        new_entries = [(find_text, replace_text) for find_text, replace_text in default_entries
+                       if find_text not in _replacement_index and find_text not in dismissed]
+        insert_default_rows(new_entries, "scanned")
     
-    for find_text, replace_text in default_entries:
-        tree.insert("", "end", values=(find_text, replace_text))
+    threading.Thread(target=scan_in_background, daemon=True).start()
+    tree.after(50, apply_scan_results)
     
     # Functions for table management
+    replacement_dialog = None
+    
+    def get_replacement_dialog():
+        """Create the shared add/edit dialog on first use."""
+        nonlocal replacement_dialog
+        if replacement_dialog is None:
+            replacement_dialog = _ReplacementDialog(parent)
+        return replacement_dialog
+    
     def add_entry():
         """Add a new entry to the table."""
-        dialog = tk.Toplevel(parent)
-        dialog.title("Add Custom Replacement")
-        dialog.geometry("400x150")
-        dialog.transient(parent)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (400 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (150 // 2)
-        dialog.geometry(f"400x150+{x}+{y}")
-        
-        ttk.Label(dialog, text="Find (Placeholder):").grid(row=0, column=0, sticky="w", padx=10, pady=5)
-        find_entry = ttk.Entry(dialog, width=40)
-        find_entry.grid(row=0, column=1, padx=10, pady=5)
-        
-        ttk.Label(dialog, text="Replace With:").grid(row=1, column=0, sticky="w", padx=10, pady=5)
-        replace_entry = ttk.Entry(dialog, width=40)
-        replace_entry.grid(row=1, column=1, padx=10, pady=5)
-        
-        def save_entry():
-            find_text = find_entry.get().strip()
-            replace_text = replace_entry.get().strip()
-            
-            if not find_text:
-                messagebox.showerror("Error", "Find field cannot be empty")
-                return
-            
+        def save_entry(find_text, replace_text):
             # Check for duplicates
-            for item in tree.get_children():
-                if tree.item(item)["values"][0] == find_text:
-                    messagebox.showerror("Error", "This placeholder already exists")
-                    return
+            if find_text in _replacement_index:
+                messagebox.showerror("Error", "This placeholder already exists")
+                return False
             
-            tree.insert("", "end", values=(find_text, replace_text))
-            dialog.destroy()
-        
-        def cancel_entry():
-            dialog.destroy()
-        
-        button_frame = ttk.Frame(dialog)
-        button_frame.grid(row=2, column=0, columnspan=2, pady=10)
-        
-        ttk.Button(button_frame, text="Add", command=save_entry).pack(side="left", padx=5)
-        ttk.Button(button_frame, text="Cancel", command=cancel_entry).pack(side="left", padx=5)
+            insert_replacement_row(tree, find_text, replace_text)
+            return True
         
-        find_entry.focus()
+        get_replacement_dialog().show("Add Custom Replacement", "Add", save_entry)
     
     def remove_entry():
         """Remove selected entry from the table."""
@@ -397,8 +782,7 @@ def create_custom_replacements_table(parent):
             messagebox.showwarning("Warning", "Please select an entry to remove")
             return
         
-        for item in selection:
-            tree.delete(item)
+        delete_replacement_rows(tree, *selection)
     
     def edit_entry():
         """Edit the selected entry."""
@@ -417,62 +801,24 @@ def create_custom_replacements_table(parent):
             messagebox.showwarning("Warning", "No entry selected")
             return
             
-        current_values = tree.item(item)["values"]
+        current_values = get_replacement_row(tree, item)
         
         # Ensure we have valid values
         if not current_values or len(current_values) < 2:
             messagebox.showerror("Error", "Invalid entry selected")
             return
         
-        dialog = tk.Toplevel(parent)
-        dialog.title("Edit Custom Replacement")
-        dialog.geometry("400x150")
-        dialog.transient(parent)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (400 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (150 // 2)
-        dialog.geometry(f"400x150+{x}+{y}")
-        
-        ttk.Label(dialog, text="Find (Placeholder):").grid(row=0, column=0, sticky="w", padx=10, pady=5)
-        find_entry = ttk.Entry(dialog, width=40)
-        find_entry.insert(0, current_values[0])
-        find_entry.grid(row=0, column=1, padx=10, pady=5)
-        
-        ttk.Label(dialog, text="Replace With:").grid(row=1, column=0, sticky="w", padx=10, pady=5)
-        replace_entry = ttk.Entry(dialog, width=40)
-        replace_entry.insert(0, current_values[1])
-        replace_entry.grid(row=1, column=1, padx=10, pady=5)
-        
-        def save_changes():
-            find_text = find_entry.get().strip()
-            replace_text = replace_entry.get().strip()
-            
-            if not find_text:
-                messagebox.showerror("Error", "Find field cannot be empty")
-                return
-            
+        def save_changes(find_text, replace_text):
             # Check for duplicates (excluding current item)
-            for other_item in tree.get_children():
-                if other_item != item and tree.item(other_item)["values"][0] == find_text:
-                    messagebox.showerror("Error", "This placeholder already exists")
-                    return
+            if _replacement_index.get(find_text, item) != item:
+                messagebox.showerror("Error", "This placeholder already exists")
+                return False
             
-            tree.item(item, values=(find_text, replace_text))
-            dialog.destroy()
-        
-        def cancel_changes():
-            dialog.destroy()
-        
-        button_frame = ttk.Frame(dialog)
-        button_frame.grid(row=2, column=0, columnspan=2, pady=10)
-        
-        ttk.Button(button_frame, text="Save", command=save_changes).pack(side="left", padx=5)
-        ttk.Button(button_frame, text="Cancel", command=cancel_changes).pack(side="left", padx=5)
+            update_replacement_row(tree, item, find_text, replace_text)
+            return True
         
-        find_entry.focus()
+        get_replacement_dialog().show("Edit Custom Replacement", "Save", save_changes,
+                                      current_values[0], current_values[1])
     
     # Buttons
     ttk.Button(button_frame, text="+ Add", command=add_entry).pack(side="left", padx=5)
@@ -585,9 +931,8 @@ def create_project_selector_frame(parent):
 
 def refresh_project_list():
     """Refresh the list of existing projects."""
-    # Clear existing items
-    for item in project_tree.get_children():
-        project_tree.delete(item)
+    # Clear existing items (one Tcl call for all rows)
+    project_tree.delete(*project_tree.get_children())
     
     # Scan for projects
     projects = scan_existing_projects()
@@ -645,12 +990,11 @@ def load_selected_project():
             messagebox.showinfo("Info", f"No CMake values found in project '{project_name}'")
         
         # Clear existing replacements table
-        for item in replacements_table.get_children():
-            replacements_table.delete(item)
+        delete_replacement_rows(replacements_table, *replacements_table.get_children())
         
         # Populate table with extracted values
         for placeholder, value in cmake_values.items():
-            replacements_table.insert("", "end", values=(placeholder, value))
+            insert_replacement_row(replacements_table, placeholder, value)
         
         # Update entry with project name
         entry.delete(0, tk.END)
@@ -679,132 +1023,385 @@ def create_cmake_fields_frame(parent):
     return {}
 
 from typing import Dict, Any
+
+def _is_version_string(value: str) -> bool:
+    """Return True if value has the X.Y.Z shape (a plain split beats a regex here)."""
+    parts = value.split('.')
+    return len(parts) == 3 and all(part.isdecimal() for part in parts)
+
+# (placeholder marker, validator, error message) for fields with a fixed format
+_FIELD_VALIDATORS = (
+    # Version validation
+    ("VERSION", _is_version_string,
+     "Invalid version format for {placeholder}: '{value}'. Must be in format X.Y.Z (e.g., 1.0.0)"),
+    # Plugin code validation (should be 4 characters)
+    ("PLUGIN_CODE", _FOUR_CHAR_CODE_RE.fullmatch,
+     "Invalid plugin code format for {placeholder}: '{value}'. Must be exactly 4 alphanumeric characters"),
+    # Manufacturer code validation (should be 4 characters)
+    ("MANUFACTURER_CODE", _FOUR_CHAR_CODE_RE.fullmatch,
+     "Invalid manufacturer code format for {placeholder}: '{value}'. Must be exactly 4 alphanumeric characters"),
+)
+
 def get_cmake_field_values(fields, replacements_tree) -> Dict[str, Any]:
     """Extract values from custom replacements table."""
     custom_replacements = {}
     
+    # One Tcl call for the row order; the values come from the in-memory mirror
     for item in replacements_tree.get_children():
-        values = replacements_tree.item(item)["values"]
-        if len(values) >= 2:
-            find_text = values[0].strip()
-            replace_text = values[1].strip()
-            if find_text:  # Only add non-empty find text
-                custom_replacements[find_text] = replace_text
-
-    # Validate specific field formats
-    for placeholder, value in custom_replacements.items():
-        placeholder_upper = placeholder.upper()
-        
-        # Version validation
-        if "VERSION" in placeholder_upper and value:
-            if not re.match(r'^\d+\.\d+\.\d+$', value):
-                raise ValueError(f"Invalid version format for {placeholder}: '{value}'. Must be in format X.Y.Z (e.g., 1.0.0)")
-        
-        # Plugin code validation (should be 4 characters)
-        if "PLUGIN_CODE" in placeholder_upper and value:
-            if not re.match(r'^[A-Za-z0-9]{4}$', value):
-                raise ValueError(f"Invalid plugin code format for {placeholder}: '{value}'. Must be exactly 4 alphanumeric characters")
-        
-        # Manufacturer code validation (should be 4 characters)
-        if "MANUFACTURER_CODE" in placeholder_upper and value:
-            if not re.match(r'^[A-Za-z0-9]{4}$', value):
-                raise ValueError(f"Invalid manufacturer code format for {placeholder}: '{value}'. Must be exactly 4 alphanumeric characters")
+        values = get_replacement_row(replacements_tree, item)
+        if len(values) < 2:
+            continue
+        
+        find_text = values[0].strip()
+        replace_text = values[1].strip()
+        if not find_text:  # Only add non-empty find text
+            continue
+        
+        # Validate specific field formats
+        if replace_text:
+            placeholder_upper = find_text.upper()
+            for marker, is_valid, error_format in _FIELD_VALIDATORS:
+                if marker in placeholder_upper and not is_valid(replace_text):
+                    raise ValueError(error_format.format(placeholder=find_text, value=replace_text))
+        
+        custom_replacements[find_text] = replace_text
 
     return {"custom_replacements": custom_replacements}
 
-def run_cmake_configure(target_dir):
-    """Run CMake configuration for the project."""
-    project_name = os.path.basename(target_dir)
-    build_dir = os.path.join(target_dir, "build")
+CMAKE_TIMEOUT = 120  # 2 minute timeout for CMake configuration
+CMAKE_CONFIG_STAMP = ".juce_pm_configured"  # Digest of the CMakeLists.txt the build dir was configured from
+CMAKE_READER_JOIN_TIMEOUT = 2  # Seconds to wait for the output reader after CMake is killed
+CMAKE_POLL_INTERVAL_MS = 100
+CMAKE_NOT_FOUND_MESSAGE = "CMake is not installed or not found in PATH.\n\nPlease install CMake and ensure it's available in your system PATH."
+CMAKE_OUTPUT_TAIL_LINES = 40  # Lines of CMake output kept for the error dialog
+CMAKE_STATUS_WIDTH = 60  # Characters of the current CMake line shown in the progress window
+
+def _run_cmake_process(args, cwd, window, timeout, cancelled=None, on_output=None):
+    """Run a CMake command without blocking the Tk event loop.
+    
+    Output (stdout and stderr merged) is read line by line by a helper thread
+    while window keeps processing events (so the progress bar animates); each
+    line is passed to the optional on_output callback on the Tk thread, and
+    only the last CMAKE_OUTPUT_TAIL_LINES lines are kept. Returns a
+    CompletedProcess whose stdout holds that tail and raises
+    subprocess.TimeoutExpired if CMake runs longer than timeout seconds.
+    If the optional cancelled BooleanVar is set meanwhile, CMake is killed
+    and None is returned.
+    """
+    process = subprocess.Popen(args, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, errors="replace", bufsize=1)
+    tail = collections.deque(maxlen=CMAKE_OUTPUT_TAIL_LINES)
+    lines = queue.Queue()
+    
+    def read_output():
+        # Always reap CMake, even if reading its output fails
+        try:
+            for line in process.stdout:
+                tail.append(line)
+                lines.put(line)
+        finally:
+            process.wait()
+    
+    reader = threading.Thread(target=read_output, daemon=True)
+    reader.start()
+    
+    finished = tk.BooleanVar(window, value=False)
+    deadline = time.monotonic() + timeout
+    
+    def drain_output():
+        while True:
+            try:
+                line = lines.get_nowait()
+            except queue.Empty:
+                return
+            if on_output and line.strip():
+                on_output(line.rstrip())
     
-    if not os.path.exists(build_dir):
-        os.makedirs(build_dir)
+    def poll():
+        drain_output()
+        if reader.is_alive() and time.monotonic() < deadline and not (cancelled and cancelled.get()):
+            window.after(CMAKE_POLL_INTERVAL_MS, poll)
+        else:
+            finished.set(True)
     
-    # Show progress dialog
-    progress_window = tk.Toplevel()
-    progress_window.title("Running CMake")
-    progress_window.geometry("400x150")
-    progress_window.transient()
-    progress_window.grab_set()
+    window.after(CMAKE_POLL_INTERVAL_MS, poll)
+    window.wait_variable(finished)
     
-    # Center the progress window
-    progress_window.update_idletasks()
-    x = (progress_window.winfo_screenwidth() // 2) - (200)
-    y = (progress_window.winfo_screenheight() // 2) - (75)
-    progress_window.geometry(f"400x150+{x}+{y}")
+    if reader.is_alive():
+        process.kill()
+        process.wait()
+        # A grandchild that inherited the pipe can keep it open; don't block the UI on it
+        reader.join(CMAKE_READER_JOIN_TIMEOUT)
+        if cancelled and cancelled.get():
+            return None
+        raise subprocess.TimeoutExpired(args, timeout)
     
-    status_label = ttk.Label(progress_window, text=f"Configuring CMake for '{project_name}'...")
-    status_label.pack(pady=20)
+    return subprocess.CompletedProcess(args, process.returncode, "".join(tail), None)
+
+def _cmake_config_key(target_dir):
+    """Return a digest of the project's CMakeLists.txt, or None if it cannot be read."""
+    try:
+        with open(os.path.join(target_dir, "CMakeLists.txt"), 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def cmake_configure_current(build_dir, config_key):
+    """Return True if build_dir holds a CMake cache from a configure of the same CMakeLists.txt."""
+    if config_key is None or not os.path.isfile(os.path.join(build_dir, "CMakeCache.txt")):
+        return False
+    try:
+        with open(os.path.join(build_dir, CMAKE_CONFIG_STAMP), 'r', encoding='utf-8') as f:
+            return f.read().strip() == config_key
+    except OSError:
+        return False
+
+def _write_cmake_config_stamp(build_dir, config_key):
+    """Record which CMakeLists.txt the build directory was configured from."""
+    if config_key is None:
+        return
+    try:
+        with open(os.path.join(build_dir, CMAKE_CONFIG_STAMP), 'w', encoding='utf-8') as f:
+            f.write(config_key)
+    except OSError as e:
+        print(f"Warning: Could not write CMake configure stamp: {e}")
+
+def _cmake_configure_args(build_dir, cmake_exe="cmake"):
+    """Return the CMake configure command line for build_dir.
+    A fresh build directory uses Ninja when it is installed, which generates faster
+    than Makefiles; an existing cache keeps its generator (CMake refuses to switch).
+    Windows keeps the default Visual Studio generator, as Ninja there only finds the
+    compiler from a developer command prompt. ccache is used as compiler launcher
+    when it is installed."""
+    args = [cmake_exe]
+    if (os.name != "nt" and shutil.which("ninja")
+            and not os.path.isfile(os.path.join(build_dir, "CMakeCache.txt"))):
+        args += ["-G", "Ninja"]
+    # With ccache installed, compiles are shared across every project made from the template
+    if shutil.which("ccache"):
+        args += ["-DCMAKE_C_COMPILER_LAUNCHER=ccache", "-DCMAKE_CXX_COMPILER_LAUNCHER=ccache"]
+    args.append("..")
+    return args
+
+class _ProgressDialog(_ReusableDialog):
+    """Modal progress window with a status label, a progress bar and a Cancel button."""
     
-    progress_bar = ttk.Progressbar(progress_window, mode='indeterminate')
-    progress_bar.pack(pady=10, padx=20, fill='x')
-    progress_bar.start()
+    HEIGHT = 180
+    
+    def __init__(self):
+        super().__init__()
+        
+        self.status_label = ttk.Label(self.window)
+        self.status_label.pack(pady=20)
+        
+        self.progress_bar = ttk.Progressbar(self.window)
+        self.progress_bar.pack(pady=10, padx=20, fill='x')
+        
+        # Cancel (or closing the window) is picked up by whoever polls `cancelled`
+        self.cancelled = tk.BooleanVar(self.window, value=False)
+        self._previous_focus = None
+        ttk.Button(self.window, text="Cancel", command=self.cancel).pack(pady=5)
+    
+    def cancel(self):
+        self.cancelled.set(True)
+    
+    def on_close(self):
+        # Closing the window while CMake runs cancels it
+        self.cancel()
+    
+    def show(self, title, message):
+        """Reset the dialog for a new run and show it."""
+        self.status_label.configure(text=message)
+        self.progress_bar.configure(mode='indeterminate', value=0)
+        self.progress_bar.start()
+        self.cancelled.set(False)
+        
+        # The grab only redirects pointer events; take the keyboard focus too, so keys
+        # pressed while CMake runs don't reach the main window
+        self._previous_focus = self.window.focus_get()
+        self._show(title)
+        self.window.focus_set()
+    
+    def hide(self):
+        self.progress_bar.stop()
+        super().hide()
+        if self._previous_focus is not None and self._previous_focus.winfo_exists():
+            self._previous_focus.focus_set()
+        self._previous_focus = None
+
+_shared_progress_dialog = None
+
+@contextlib.contextmanager
+def _progress_dialog(title, message):
+    """Show the shared progress dialog for the duration of the block.
+    Yields the _ProgressDialog; however the block is left, it is hidden again."""
+    global _shared_progress_dialog
+    if _shared_progress_dialog is None or not _shared_progress_dialog.window.winfo_exists():
+        _shared_progress_dialog = _ProgressDialog()
+    
+    dialog = _shared_progress_dialog
+    dialog.show(title, message)
+    try:
+        yield dialog
+    finally:
+        dialog.hide()
+
+def run_cmake_configure(target_dir):
+    """Run CMake configuration for the project.
+    Skipped when the build directory was already configured from an identical CMakeLists.txt."""
+    project_name = os.path.basename(target_dir)
+    build_dir = os.path.join(target_dir, "build")
+    
+    config_key = _cmake_config_key(target_dir)
+    if cmake_configure_current(build_dir, config_key):
+        return True
+    
+    # Check for CMake before any window is shown; the resolved path also spares
+    # the child a second PATH search
+    cmake_exe = shutil.which("cmake")
+    if cmake_exe is None:
+        messagebox.showerror("CMake Not Found", CMAKE_NOT_FOUND_MESSAGE)
+        return False
     
-    # Force window to show
-    progress_window.update()
+    os.makedirs(build_dir, exist_ok=True)
     
     try:
-        # Run CMake configuration
-        result = subprocess.run(
-            ["cmake", ".."],
-            cwd=build_dir,
-            capture_output=True,
-            text=True,
-            timeout=120  # 2 minute timeout
-        )
+        with _progress_dialog("Running CMake", f"Configuring CMake for '{project_name}'...") as dialog:
+            def show_cmake_step(line):
+                """Show the current CMake line; configure/generate markers drive the progress bar."""
+                dialog.status_label.config(text=line[:CMAKE_STATUS_WIDTH])
+                if line.startswith("-- Configuring done"):
+                    dialog.progress_bar.stop()
+                    dialog.progress_bar.config(mode='determinate', value=50)
+                elif line.startswith("-- Generating done"):
+                    dialog.progress_bar.config(mode='determinate', value=100)
+            
+            # No update() here: _run_cmake_process waits in the Tk event loop, which maps
+            # and draws the window without re-entering every pending callback first
+            
+            # Run CMake configuration
+            result = _run_cmake_process(
+                _cmake_configure_args(build_dir, cmake_exe),
+                build_dir,
+                dialog.window,
+                timeout=CMAKE_TIMEOUT,
+                cancelled=dialog.cancelled,
+                on_output=show_cmake_step
+            )
         
-        progress_bar.stop()
-        progress_window.destroy()
+        # CMake has just (re)written the cache; don't wait for the TTL to expire
+        invalidate_cmake_ready(target_dir)
         
-        if result.returncode == 0:
+        if result is None:
+            messagebox.showinfo("Cancelled", "CMake configuration was cancelled.")
+            return False
+        elif result.returncode == 0:
+            _write_cmake_config_stamp(build_dir, config_key)
             messagebox.showinfo("Success", f"CMake configuration completed successfully!\nLaunching UI generator...")
             return True
         else:
-            error_msg = f"CMake configuration failed!\n\nReturn code: {result.returncode}\n\nError output:\n{result.stderr}"
-            if result.stdout:
-                error_msg += f"\n\nStandard output:\n{result.stdout}"
-            messagebox.showerror("CMake Error", error_msg)
+            show_cmake_error(f"CMake configuration failed! Return code: {result.returncode}", result.stdout)
             return False
-            
+    
+    # The progress window is already hidden when these run (see _progress_dialog)
     except subprocess.TimeoutExpired:
-        progress_bar.stop()
-        progress_window.destroy()
         messagebox.showerror("Timeout", "CMake configuration timed out after 2 minutes.")
         return False
         
     except FileNotFoundError:
-        progress_bar.stop()
-        progress_window.destroy()
-        messagebox.showerror(
-            "CMake Not Found", 
-            "CMake is not installed or not found in PATH.\n\nPlease install CMake and ensure it's available in your system PATH."
-        )
+        messagebox.showerror("CMake Not Found", CMAKE_NOT_FOUND_MESSAGE)
         return False
         
     except Exception as e:
-        progress_bar.stop()
-        progress_window.destroy()
         messagebox.showerror("Error", f"An error occurred while running CMake:\n\n{str(e)}")
         return False
 
+def show_cmake_error(message, output):
+    """Show a CMake failure with its output in a scrollable, read-only text box
+    (a messagebox truncates long output and cannot be copied from)."""
+    error_window = tk.Toplevel()
+    error_window.title("CMake Error")
+    error_window.geometry("700x400")
+    error_window.transient()
+    
+    ttk.Label(error_window, text=message, foreground="red").pack(anchor="w", padx=10, pady=(10, 5))
+    if output:
+        ttk.Label(error_window, text=f"Output (last {CMAKE_OUTPUT_TAIL_LINES} lines):").pack(anchor="w", padx=10)
+    
+    output_text = scrolledtext.ScrolledText(error_window, wrap="none", height=15)
+    output_text.pack(fill="both", expand=True, padx=10, pady=5)
+    output_text.insert("1.0", output or "")
+    # Read-only, but the text can still be selected and copied
+    output_text.configure(state="disabled")
+    output_text.see("end")
+    
+    ttk.Button(error_window, text="Close", command=error_window.destroy).pack(pady=(0, 10))
+    return error_window
+
+UI_GENERATOR_NOTICE_MS = 3000  # How long the launch notice stays up after starting the UI generator
+
+def show_launch_notice(message):
+    """Show a non-modal notice with an indeterminate progress bar.
+    The caller destroys the returned window once the work is done (or schedules it)."""
+    notice_window = tk.Toplevel()
+    notice_window.title("Launching UI Generator")
+    notice_window.geometry("400x100")
+    notice_window.transient()
+    
+    ttk.Label(notice_window, text=message).pack(pady=(15, 5))
+    progress_bar = ttk.Progressbar(notice_window, mode='indeterminate')
+    progress_bar.pack(pady=5, padx=20, fill='x')
+    progress_bar.start()
+    
+    # Draw it once; no grab, so nothing waits for the user to click
+    notice_window.update_idletasks()
+    return notice_window
+
 def run_ui_generator(target_dir):
     """Run the UI generator application with the target directory."""
     project_name = os.path.basename(target_dir)
     
     # Check if CMake is already configured
-    if cmake_ready(target_dir):
-        messagebox.showinfo("CMake Ready", f"CMake is already configured for '{project_name}'.\nLaunching UI generator...")
-    else:
+    if not cmake_ready(target_dir):
         # Run CMake configuration automatically
         if not run_cmake_configure(target_dir):
             return  # CMake failed, don't continue
     
-    # Launch the UI generator
-    app = UIGeneratorApp(target_dir)
-    app.run()
+    notice_window = show_launch_notice(f"CMake is configured for '{project_name}'.\nLaunching UI generator...")
+    
+    # Run the UI generator as its own process: the initializer stays responsive, the
+    # two Tk roots never share an interpreter, and the designer's modules load there
+    try:
+        subprocess.Popen([sys.executable, "-m", "src.UIGeneratorApp", target_dir],
+                         cwd=os.path.dirname(os.path.abspath(__file__)), start_new_session=True)
+    except OSError as e:
+        notice_window.destroy()
+        messagebox.showerror("Error", f"Could not launch the UI generator:\n\n{str(e)}")
+        return
+    
+    # Popen returns once the process has started; leave the notice up while its window opens
+    notice_window.after(UI_GENERATOR_NOTICE_MS, notice_window.destroy)
+
+# Set while on_create runs. CMake is waited for in a nested Tk event loop, so the
+# Create button or <Return> could otherwise start a second create mid-configure
+_create_in_progress = False
 
 def on_create():
-    """Handle project creation button click."""
+    """Handle project creation button click (ignored while a create is still running)."""
+    global _create_in_progress
+    if _create_in_progress:
+        return
+    
+    _create_in_progress = True
+    create_btn.state(['disabled'])
+    try:
+        create_or_update_project()
+    finally:
+        _create_in_progress = False
+        create_btn.state(['!disabled'])
+
+def create_or_update_project():
+    """Create or update the project named in the entry, then launch the UI generator."""
     project_name = entry.get().strip()
     if not project_name:
         messagebox.showerror("Error", "Please enter a project name.")
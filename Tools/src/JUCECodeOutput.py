@@ -1,7 +1,31 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 from src.JUCECodeSections import JUCECodeSections
 
-@dataclass 
+# Static comment banners of get_formatted_output, built once instead of per call
+_RULE = "// ========================================\n"
+_OUTPUT_HEADER = _RULE + "// JUCE Audio Plugin GUI Code Generation\n" + _RULE + "\n"
+
+def _section_banner(title: str, instruction: str, leading_newline: bool = True) -> str:
+    """Build the comment banner that introduces one section of the output"""
+    return ("\n" if leading_newline else "") + _RULE + f"// {title}\n// {instruction}\n" + _RULE + "\n"
+
+_EDITOR_HEADER_BANNER = _section_banner(
+    "EDITOR HEADER (.h file)", "Add these declarations to your PluginEditor class:", leading_newline=False)
+_EDITOR_CONSTRUCTOR_BANNER = _section_banner(
+    "EDITOR CONSTRUCTOR (.cpp file)", "Add this to your PluginEditor constructor:")
+_EDITOR_PAINT_BANNER = _section_banner(
+    "EDITOR PAINT METHOD (.cpp file)", "Add this code to your to your PluginEditor paint method:")
+_EDITOR_RESIZED_BANNER = _section_banner(
+    "EDITOR RESIZED METHOD (.cpp file)", "Add this code to your to your PluginEditor resized method:")
+_PROCESSOR_HEADER_BANNER = _section_banner(
+    "PROCESSOR HEADER (.h file)", "Add these declarations to your PluginProcessor class:")
+_PROCESSOR_CONSTRUCTOR_BANNER = _section_banner(
+    "PROCESSOR CONSTRUCTOR (.cpp file)", "Add this to your PluginProcessor constructor:")
+_PROCESSOR_PARAMETER_LAYOUT_BANNER = _section_banner(
+    "PROCESSOR PARAMETER LAYOUT (.cpp file)", "Add this to your PluginProcessor createParameterLayout method:")
+
+@dataclass(slots=True)
 class JUCECodeOutput:
     """Complete JUCE code output with all sections organized"""
     editor_header_declarations: str
@@ -11,6 +35,8 @@ class JUCECodeOutput:
     processor_header_declarations: str
     processor_constructor_code: str
     processor_parameter_layout_code: str = ""
+    # Memoized get_formatted_output result; the sections are not changed after construction
+    _formatted_output: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __init__(self, code_sections: JUCECodeSections):
         self.editor_header_declarations = code_sections.editor_header_declarations
@@ -20,82 +46,21 @@ class JUCECodeOutput:
         self.processor_header_declarations = code_sections.processor_header_declarations
         self.processor_constructor_code = code_sections.processor_constructor_code
         self.processor_parameter_layout_code = code_sections.processor_parameter_layout_code
+        self._formatted_output = None
     
     def get_formatted_output(self) -> str:
-        """Get the complete formatted code output as a string"""
-        code = "// ========================================\n"
-        code += "// JUCE Audio Plugin GUI Code Generation\n"
-        code += "// ========================================\n\n"
-        
-        code += "// ========================================\n"
-        code += "// EDITOR HEADER (.h file)\n"
-        code += "// Add these declarations to your PluginEditor class:\n"
-        code += "// ========================================\n\n"
-        code += self.editor_header_declarations
-        
-        code += "\n// ========================================\n"
-        code += "// EDITOR CONSTRUCTOR (.cpp file)\n"
-        code += "// Add this to your PluginEditor constructor:\n"
-        code += "// ========================================\n\n"
-        code += self.editor_constructor_code
+        """Get the complete formatted code output as a string (built on first call)"""
+        if self._formatted_output is not None:
+            return self._formatted_output
         
-        code += "\n// ========================================\n"
-        code += "// EDITOR PAINT METHOD (.cpp file)\n"
-        code += "// Add this code to your to your PluginEditor paint method:\n"
-        code += "// ========================================\n\n"
-        code += self.editor_paint_method
-        
-        code += "\n// ========================================\n"
-        code += "// EDITOR RESIZED METHOD (.cpp file)\n"
-        code += "// Add this code to your to your PluginEditor resized method:\n"
-        code += "// ========================================\n\n"
-        code += self.editor_resized_method
-        
-        code += "\n// ========================================\n"
-        code += "// PROCESSOR HEADER (.h file)\n"
-        code += "// Add these declarations to your PluginProcessor class:\n"
-        code += "// ========================================\n\n"
-        code += self.processor_header_declarations
-        
-        code += "\n// ========================================\n"
-        code += "// PROCESSOR CONSTRUCTOR (.cpp file)\n"
-        code += "// Add this to your PluginProcessor constructor:\n"
-        code += "// ========================================\n\n"
-        code += self.processor_constructor_code
-
-        code += "\n// ========================================\n"
-        code += "// PROCESSOR PARAMETER LAYOUT (.cpp file)\n"
-        code += "// Add this to your PluginProcessor createParameterLayout method:\n"
-        code += "// ========================================\n\n"
-        code += self.processor_parameter_layout_code
-
-        
-        return code
-    
-    def get_editor_header_code(self) -> str:
-        """Get only the editor header declarations"""
-        return self.editor_header_declarations
-    
-    def get_editor_constructor_code(self) -> str:
-        """Get only the editor constructor code"""
-        return self.editor_constructor_code
-        
-    def get_processor_header_code(self) -> str:
-        """Get only the processor header declarations"""
-        return self.processor_header_declarations
-        
-    def get_processor_constructor_code(self) -> str:
-        """Get only the processor constructor code"""
-        return self.processor_constructor_code
-           
-    def get_editor_paint_code(self) -> str:
-        """Get only the editor paint method code"""
-        return self.editor_paint_method
-    
-    def get_editor_resized_code(self) -> str:
-        """Get only the editor resized method code"""
-        return self.editor_resized_method
-    
-    def get_processor_parameter_layout_code(self) -> str:
-        """Get only the processor parameter layout code"""
-        return self.processor_parameter_layout_code
+        self._formatted_output = "".join((
+            _OUTPUT_HEADER,
+            _EDITOR_HEADER_BANNER, self.editor_header_declarations,
+            _EDITOR_CONSTRUCTOR_BANNER, self.editor_constructor_code,
+            _EDITOR_PAINT_BANNER, self.editor_paint_method,
+            _EDITOR_RESIZED_BANNER, self.editor_resized_method,
+            _PROCESSOR_HEADER_BANNER, self.processor_header_declarations,
+            _PROCESSOR_CONSTRUCTOR_BANNER, self.processor_constructor_code,
+            _PROCESSOR_PARAMETER_LAYOUT_BANNER, self.processor_parameter_layout_code,
+        ))
+        return self._formatted_output
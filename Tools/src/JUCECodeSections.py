@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class JUCECodeSections:
     """Container for different sections of JUCE code"""
     editor_header_declarations: str = ""
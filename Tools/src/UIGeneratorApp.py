@@ -6,6 +6,7 @@ A drag-and-drop interface designer for audio plugins
 
 import os
 import sys
+import logging
 import traceback
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
@@ -28,8 +29,17 @@ except ImportError as e:
     input("Press Enter to exit...")
     exit(1)
 
+# Debug output goes through logging, which skips formatting when DEBUG is not enabled
+logger = logging.getLogger(__name__)
+
+# Empirical observation: the canvas widget reports 4px larger than the intended canvas size
+# (border bd=2 plus internal padding); subtracting 8px per dimension gives the correct size
+CANVAS_WIDGET_OFFSET = 8
+
 class UIGeneratorApp:
     """Main application class"""
+    
+    EXPORT_FORMATS = ("JUCE", "VST3", "Generic XML", "JSON")
 
     def __init__(self, juce_target_dir: str):
         try:
@@ -50,6 +60,21 @@ class UIGeneratorApp:
             # Initialize JUCE controls list
             self.juce_controls = []
             
+            # Pending after_idle id of a coalesced _apply_gui_properties call, the
+            # (bg, width, height, show_grid, grid_size) it last applied and the window title
+            self._apply_pending = None
+            self._applied_gui_state = None
+            self._window_title = self.root.title()
+            # Drawing area size, kept up to date from the canvas <Configure> events so
+            # saving and exporting don't have to query Tk for it
+            self._drawing_size = (0, 0)
+            # Widget size from the last <Configure> event; the grid is redrawn when it changes
+            self._canvas_widget_size = None
+            # Export dialog, built on first use and hidden instead of destroyed when closed
+            self._export_dialog = None
+            self._export_format_var = None
+            self._export_code_text = None
+            
             self._create_menu()
             self._create_layout()
             self._create_status_bar()
@@ -135,6 +160,7 @@ class UIGeneratorApp:
                                          self.gui_properties.width, 
                                          self.gui_properties.height, 
                                          self)
+        self.canvas_frame.canvas.bind('<Configure>', self._on_canvas_configure, add='+')
         
         # Set canvas reference in toolbox
         self.toolbox.canvas = self.canvas_frame
@@ -188,13 +214,12 @@ class UIGeneratorApp:
     
     def new_file(self):
         """Create new file"""
-        if messagebox.askokcancel(title="New File", message="Clear current design?", options={ "default": True }):
-            self.canvas_frame.components.clear()
-            self.canvas_frame.canvas.delete("all")
-            self.canvas_frame.selected_component = None
+        if messagebox.askokcancel("New File", "Clear current design?", default=messagebox.OK):
+            self.canvas_frame.sync_to({})
             self.properties.clear_properties()
             
             # Clear JUCE controls
+            self.canvas_frame.canvas.delete("juce_control")
             self.juce_controls.clear()
             self.juce_properties.update_properties(None)
             
@@ -205,7 +230,7 @@ class UIGeneratorApp:
             self._apply_gui_properties()
             
             self.filename = None
-            self.root.title("Audio Plugin GUI Designer - Untitled")
+            self._set_window_title("Audio Plugin GUI Designer - Untitled")
             self.status_var.set("New file created")
     
     def open_file(self):
@@ -219,14 +244,11 @@ class UIGeneratorApp:
             try:
                 components, width, height, gui_properties_data, juce_controls = FileManager.load_design(filename)
                 
-                # Clear current design
-                self.canvas_frame.components.clear()
-                self.canvas_frame.canvas.delete("all")
-                
-                # Load components
-                self.canvas_frame.components = components
+                # Load components, redrawing only those that differ from the current design
+                self.canvas_frame.sync_to(components)
                 
                 # Load JUCE controls
+                self.canvas_frame.canvas.delete("juce_control")
                 self.juce_controls = juce_controls
                 for control in self.juce_controls:
                     self._draw_juce_control_on_canvas(control)
@@ -237,11 +259,8 @@ class UIGeneratorApp:
                     self.gui_properties_panel.update_widgets()
                     self._apply_gui_properties()
                 
-                # Redraw all components
-                self.canvas_frame.redraw_all()
-                
                 self.filename = filename
-                self.root.title(f"Audio Plugin GUI Designer - {os.path.basename(filename)}")
+                self._set_window_title(f"Audio Plugin GUI Designer - {os.path.basename(filename)}")
                 self.status_var.set(f"Loaded {len(self.canvas_frame.components)} components and {len(self.juce_controls)} JUCE controls")
                 
             except Exception as e:
@@ -265,21 +284,12 @@ class UIGeneratorApp:
         if filename:
             self._save_to_file(filename)
             self.filename = filename
-            self.root.title(f"Audio Plugin GUI Designer - {os.path.basename(filename)}")
+            self._set_window_title(f"Audio Plugin GUI Designer - {os.path.basename(filename)}")
     
     def _save_to_file(self, filename: str):
         """Save design to file"""
         try:
-            # Get the actual drawing area size by subtracting total widget padding
-            # The canvas widget includes border (bd=2) plus additional internal padding
-            canvas_widget_width = self.canvas_frame.canvas.winfo_width()
-            canvas_widget_height = self.canvas_frame.canvas.winfo_height()
-            
-            # Empirical observation: widget reports 4px larger than intended canvas size
-            # Need to subtract 8px per dimension to get correct size (double the observed offset)
-            total_offset = 8
-            actual_drawing_width = canvas_widget_width - total_offset
-            actual_drawing_height = canvas_widget_height - total_offset
+            actual_drawing_width, actual_drawing_height = self._drawing_size
             
             FileManager.save_design(
                 filename, 
@@ -313,23 +323,31 @@ class UIGeneratorApp:
         )
 
     def _show_export_dialog(self):
-        """Show export dialog"""
+        """Show export dialog (the widgets are built once and reused on later exports)"""
+        if self._export_dialog is not None and self._export_dialog.winfo_exists():
+            self._export_dialog.deiconify()
+            self._export_dialog.lift()
+            self._update_export_code()
+            return
+        
         export_window = tk.Toplevel(self.root)
         export_window.title("Export Code")
         export_window.geometry("600x400")
+        # Closing only hides the dialog so the next export can show it again
+        export_window.protocol("WM_DELETE_WINDOW", export_window.withdraw)
         
         # Format selection
         format_frame = ttk.Frame(export_window)
         format_frame.pack(fill='x', padx=10, pady=5)
         ttk.Label(format_frame, text="Export Format:").pack(side='left')
         
-        format_var = tk.StringVar(value="JUCE")
-        format_combo = ttk.Combobox(format_frame, textvariable=format_var, 
-                                   values=["JUCE", "VST3", "Generic XML", "JSON"])
+        self._export_format_var = tk.StringVar(value="JUCE")
+        format_combo = ttk.Combobox(format_frame, textvariable=self._export_format_var, 
+                                   values=self.EXPORT_FORMATS)
         format_combo.pack(side='left', padx=5)
         
         # Code display
-        code_text = tk.Text(export_window, wrap='none')
+        code_text = self._export_code_text = tk.Text(export_window, wrap='none')
         scrollbar_y = ttk.Scrollbar(export_window, orient='vertical', command=code_text.yview)
         scrollbar_x = ttk.Scrollbar(export_window, orient='horizontal', command=code_text.xview)
         code_text.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
@@ -338,48 +356,8 @@ class UIGeneratorApp:
         scrollbar_y.pack(side='right', fill='y', pady=5)
         scrollbar_x.pack(side='bottom', fill='x', padx=10)
         
-        def update_code():
-            format_type = format_var.get()
-            # Get the actual drawing area size by subtracting total widget padding
-            # The canvas widget includes border (bd=2) plus additional internal padding
-            canvas_widget_width = self.canvas_frame.canvas.winfo_width()
-            canvas_widget_height = self.canvas_frame.canvas.winfo_height()
-            
-            # Empirical observation: widget reports 4px larger than intended canvas size
-            # Need to subtract 8px per dimension to get correct size (double the observed offset)
-            total_offset = 8  
-            actual_drawing_width = canvas_widget_width - total_offset
-            actual_drawing_height = canvas_widget_height - total_offset
-            
-            # Debug output (temporary)
-            print(f"DEBUG: Widget size: {canvas_widget_width}x{canvas_widget_height}")
-            print(f"DEBUG: Drawing area: {actual_drawing_width}x{actual_drawing_height}")
-            
-            generator = CodeGenerator(
-                self.canvas_frame.components,
-                actual_drawing_width,
-                actual_drawing_height,
-                self.gui_properties.background_color,
-            )
-            
-            if format_type == "JUCE":
-                juce_output = generator.generate_juce_code()
-                code_writer = CodeWriter()
-                target_directory = self._get_juce_target_directory()
-                code_writer.write_code(juce_output, target_directory)
-                code = juce_output.get_formatted_output()
-            elif format_type == "JSON":
-                code = generator.generate_json_code()
-            elif format_type == "Generic XML":
-                code = generator.generate_xml_code()
-            else:
-                code = f"// Code generation for {format_type} not implemented yet\n"
-                
-            code_text.delete(1.0, tk.END)
-            code_text.insert(1.0, code)
-        
-        format_combo.bind('<<ComboboxSelected>>', lambda e: update_code())
-        update_code()  # Initial load
+        format_combo.bind('<<ComboboxSelected>>', self._update_export_code)
+        self._update_export_code()  # Initial load
         
         # Buttons
         btn_frame = ttk.Frame(export_window)
@@ -388,9 +366,39 @@ class UIGeneratorApp:
                   command=lambda: self._save_code(code_text.get(1.0, tk.END))).pack(side='right', padx=5)
         ttk.Button(btn_frame, text="Copy to Clipboard", 
                   command=lambda: self._copy_to_clipboard(code_text.get(1.0, tk.END))).pack(side='right')
+        
+        self._export_dialog = export_window
     
+    def _update_export_code(self, event=None):
+        """Regenerate the export dialog code for the selected format"""
+        format_type = self._export_format_var.get()
+        actual_drawing_width, actual_drawing_height = self._drawing_size
+        logger.debug("Drawing area: %dx%d", actual_drawing_width, actual_drawing_height)
+        
+        generator = CodeGenerator(
+            self.canvas_frame.components,
+            actual_drawing_width,
+            actual_drawing_height,
+            self.gui_properties.background_color,
+        )
+        
+        if format_type == "JUCE":
+            juce_output = generator.generate_juce_code()
+            code_writer = CodeWriter()
+            target_directory = self._get_juce_target_directory()
+            code_writer.write_code(juce_output, target_directory)
+            code = juce_output.get_formatted_output()
+        elif format_type == "JSON":
+            code = generator.generate_json_code()
+        elif format_type == "Generic XML":
+            code = generator.generate_xml_code()
+        else:
+            code = f"// Code generation for {format_type} not implemented yet\n"
+        
+        # One Tk call swaps the whole text (generated code is well under the size where
+        # chunked inserts would pay off)
+        self._export_code_text.replace(1.0, tk.END, code)
     
-
     def _save_code(self, code: str):
         """Save generated code to file"""
         filename = filedialog.asksaveasfilename(
@@ -416,12 +424,11 @@ class UIGeneratorApp:
     def clear_all(self):
         """Clear all components"""
         if messagebox.askokcancel("Clear All", "Remove all components and JUCE controls?"):
-            self.canvas_frame.components.clear()
-            self.canvas_frame.canvas.delete("all")
-            self.canvas_frame.selected_component = None
+            self.canvas_frame.sync_to({})
             self.properties.clear_properties()
             
             # Clear JUCE controls
+            self.canvas_frame.canvas.delete("juce_control")
             self.juce_controls.clear()
             self.juce_properties.update_properties(None)
             
@@ -430,6 +437,8 @@ class UIGeneratorApp:
     def reset_canvas_size(self):
         """Reset canvas to default size"""
         self.canvas_frame.canvas.configure(width=400, height=300)
+        # The canvas no longer matches the applied GUI properties; the next change re-applies them all
+        self._applied_gui_state = None
         self.status_var.set("Canvas size reset to 400x300")
     
     def toggle_grid(self):
@@ -447,28 +456,65 @@ class UIGeneratorApp:
     
     def on_gui_properties_changed(self, gui_properties: 'GUIProperties'):
         """Handle changes to GUI properties"""
-        self._apply_gui_properties()
+        # Property edits can arrive many times per second; apply them once when Tk is idle
+        if self._apply_pending is None:
+            self._apply_pending = self.root.after_idle(self._do_apply)
         self.status_var.set("GUI properties updated")
     
+    def _do_apply(self):
+        """Run the GUI properties update scheduled by on_gui_properties_changed"""
+        self._apply_pending = None
+        self._apply_gui_properties()
+    
     def _apply_gui_properties(self):
-        """Apply GUI properties to the canvas and interface"""
+        """Apply GUI properties to the canvas and interface.
+        Only the parts whose inputs changed since the last call are updated; code that changes
+        the canvas directly must reset _applied_gui_state so the next call re-applies everything."""
+        props = self.gui_properties
+        state = (props.background_color, props.width, props.height, props.show_grid, props.grid_size)
+        last = self._applied_gui_state
+        self._applied_gui_state = state
+        
         # Update canvas background color
-        self.canvas_frame.canvas.configure(bg=self.gui_properties.background_color)
+        if last is None or last[0] != state[0]:
+            self.canvas_frame.canvas.configure(bg=props.background_color)
         
         # Update canvas size using the new method
-        print(f"Updating canvas size to {self.gui_properties.width}x{self.gui_properties.height}")  # Debug
-        self.canvas_frame.update_canvas_size(self.gui_properties.width, self.gui_properties.height)
+        if last is None or last[1:3] != state[1:3]:
+            logger.debug("Updating canvas size to %sx%s", props.width, props.height)
+            self.canvas_frame.update_canvas_size(props.width, props.height)
+            # Until the resize is mapped and reported by <Configure>, assume the requested size
+            self._drawing_size = (props.width, props.height)
         
         # Update window title
-        title = f"Audio Plugin GUI Designer - {self.gui_properties.title}"
+        title = f"Audio Plugin GUI Designer - {props.title}"
         if self.filename:
             title += f" - {os.path.basename(self.filename)}"
-        self.root.title(title)
+        if title != self._window_title:
+            self._set_window_title(title)
         
-        # Redraw grid if enabled
+        # Redraw grid if enabled; after a resize _on_canvas_configure redraws it, as the
+        # canvas only reports its new size once Tk has applied the geometry change
+        if last is None or last[3:5] != state[3:5]:
+            self._redraw_grid()
+    
+    def _redraw_grid(self):
+        """Draw the grid for the current GUI properties over the whole canvas"""
         if hasattr(self.canvas_frame, 'draw_grid'):
             self.canvas_frame.draw_grid(self.gui_properties.show_grid, self.gui_properties.grid_size)
     
+    def _on_canvas_configure(self, event):
+        """Track the canvas drawing area size as the widget is resized, redrawing the grid for it"""
+        self._drawing_size = (event.width - CANVAS_WIDGET_OFFSET, event.height - CANVAS_WIDGET_OFFSET)
+        if (event.width, event.height) != self._canvas_widget_size:
+            self._canvas_widget_size = (event.width, event.height)
+            self._redraw_grid()
+    
+    def _set_window_title(self, title: str):
+        """Set the window title, remembering it so unchanged titles are not re-sent to Tk"""
+        self._window_title = title
+        self.root.title(title)
+    
     def run(self):
         """Start the application"""
         self.root.mainloop()
@@ -662,4 +708,8 @@ class UIGeneratorApp:
             # Clear properties panel
             self.juce_properties.update_properties(None)
             
-            self.status_var.set("All JUCE controls cleared")
\ No newline at end of file
+            self.status_var.set("All JUCE controls cleared")
+
+if __name__ == "__main__":
+    # Started by the project initializer as: python -m src.UIGeneratorApp <juce_target_dir>
+    UIGeneratorApp(sys.argv[1] if len(sys.argv) > 1 else "").run()
@@ -62,16 +62,8 @@ class CodeGenerator:
         sections.editor_resized_code = self._generate_editor_resized_method()
         sections.processor_parameter_layout_code = self._generate_parameter_layout()
 
-        # Return structured output
-        return JUCECodeOutput(JUCECodeSections(
-            editor_header_declarations=sections.editor_header_declarations,
-            editor_constructor_code=sections.editor_constructor_code,
-            editor_paint_code=sections.editor_paint_code,
-            editor_resized_code=sections.editor_resized_code,
-            processor_header_declarations=sections.processor_header_declarations,
-            processor_constructor_code=sections.processor_constructor_code,
-            processor_parameter_layout_code=sections.processor_parameter_layout_code
-        ))
+        # Return structured output (JUCECodeOutput copies the fields, so the sections can be passed as-is)
+        return JUCECodeOutput(sections)
     
 
     def _generate_juce_horizontal_slider(self, hslider: HorizontalSlider, hslider_name: str, sections: JUCECodeSections):
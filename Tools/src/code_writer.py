@@ -24,13 +24,13 @@ class CodeWriter:
         if not self._check_files_exist(output_dir):
             raise FileNotFoundError("Required code files do not exist in the output directory.")
         
-        self._write_to_plugin_editor_h(code.get_editor_header_code())
-        self._write_to_plugin_editor_ctor(code.get_editor_constructor_code())
-        self._write_to_plugin_editor_paint(code.get_editor_paint_code())
-        self._write_to_plugin_editor_resized(code.get_editor_resized_code())
-        self._write_to_plugin_processor_h(code.get_processor_header_code())
-        self._write_to_plugin_processor_ctor(code.get_processor_constructor_code())
-        self._write_to_plugin_processor_parameter_layout(code.get_processor_parameter_layout_code())
+        self._write_to_plugin_editor_h(code.editor_header_declarations)
+        self._write_to_plugin_editor_ctor(code.editor_constructor_code)
+        self._write_to_plugin_editor_paint(code.editor_paint_method)
+        self._write_to_plugin_editor_resized(code.editor_resized_method)
+        self._write_to_plugin_processor_h(code.processor_header_declarations)
+        self._write_to_plugin_processor_ctor(code.processor_constructor_code)
+        self._write_to_plugin_processor_parameter_layout(code.processor_parameter_layout_code)
 
     def _check_files_exist(self, output_dir: str) -> bool:
         """Check if the required JUCE code files exist in the output directory."""
@@ -137,14 +137,6 @@ if __name__ == "__main__":
     # Example usage
     code_writer = CodeWriter()
     juce_output = JUCECodeOutput(JUCECodeSections(),)
-    
-    # Assuming JUCECodeOutput has methods to generate code sections
-    juce_output.get_editor_header_code()
-    juce_output.get_editor_constructor_code()
-    juce_output.get_editor_paint_code()
-    juce_output.get_editor_resized_code()
-    juce_output.get_processor_header_code()
-    juce_output.get_processor_constructor_code()
 
     try:
         code_writer.write_code(juce_output, output_dir="path/to/your/juce/project")
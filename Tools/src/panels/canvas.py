@@ -5,10 +5,15 @@ Canvas widget for drag-and-drop component operations
 
 import tkinter as tk
 import uuid
+import dataclasses
 from typing import Dict, Optional
 from ..components.component import Component
 from ..components import create_component
 
+def _drawn_state(component: Component) -> tuple:
+    """Everything that affects how a component is drawn"""
+    return (type(component), dataclasses.astuple(component))
+
 class DragDropCanvas:
     """Canvas that supports drag and drop operations"""
     
@@ -23,6 +28,8 @@ class DragDropCanvas:
         self.components: Dict[str, Component] = {}
         self.selected_component: Optional[str] = None
         self.drag_data = {"x": 0, "y": 0, "item": None}
+        # State of each component as it was last drawn, so sync_to can skip unchanged ones
+        self._drawn: Dict[str, tuple] = {}
         
         self._setup_events()
         self._setup_context_menu()
@@ -69,6 +76,8 @@ class DragDropCanvas:
         # Draw selection highlight if selected
         if self.selected_component == component.id:
             component.draw_selection_highlight(self.canvas)
+        
+        self._drawn[component.id] = _drawn_state(component)
     
     def draw_grid(self, show_grid: bool, grid_size: int = 10):
         """Draw or remove grid lines on the canvas"""
@@ -98,6 +107,22 @@ class DragDropCanvas:
         for component in self.components.values():
             self.draw_component(component)
     
+    def sync_to(self, components: Dict[str, Component]):
+        """Replace the displayed components with the given ones.
+        Only components that were removed, added or changed touch the canvas; the selection is cleared."""
+        if self.selected_component:
+            self.canvas.delete(f"comp_{self.selected_component}_select")
+            self.selected_component = None
+        
+        for comp_id in self._drawn.keys() - components.keys():
+            self.canvas.delete(f"comp_{comp_id}")
+            del self._drawn[comp_id]
+        
+        self.components = components
+        for component in components.values():
+            if self._drawn.get(component.id) != _drawn_state(component):
+                self.draw_component(component)
+    
     def on_click(self, event):
         """Handle mouse click"""
         item = self.canvas.find_closest(event.x, event.y)[0]
@@ -185,6 +210,7 @@ class DragDropCanvas:
             self.canvas.delete(f"comp_{self.selected_component}")
             self.canvas.delete(f"comp_{self.selected_component}_select")
             del self.components[self.selected_component]
+            self._drawn.pop(self.selected_component, None)
             self.selected_component = None
     
     def duplicate_selected(self):